@@ -1,30 +1,58 @@
-
 import sys
+import time
 
+import click
 from dask.distributed import Client
 from asciimatics.scene import Scene
 from asciimatics.screen import Screen
-from asciimatics.widgets import VerticalDivider
-from asciimatics.exceptions import ResizeScreenError
+from asciimatics.exceptions import ResizeScreenError, StopApplication
 
 from dtop.workers import WorkerInfoManager, WorkerInfoScene
 
 
-def demo(screen: Screen, scene):
+def demo(screen: Screen, workers: WorkerInfoManager, scene, fps: int):
     scenes = [
-        Scene([WorkerInfoScene(screen, workers)], -1, name="Worker Info"),
+        Scene([WorkerInfoScene(screen, workers, fps=fps)], -1, name="Worker Info"),
     ]
     screen.force_update()
-    screen.play(scenes, stop_on_resize=True, start_scene=scene, allow_int=True)
-
-
-c = Client('tcp://127.0.0.1:8786')
+    screen.set_scenes(scenes, start_scene=scene)
 
-workers = WorkerInfoManager(c)
-last_scene = None
-while True:
+    # Pace the frames ourselves rather than with `Screen.play`, which is fixed at 20 frames per second
+    frame_period = 1 / fps
     try:
-        Screen.wrapper(demo, arguments=[last_scene])
-        sys.exit(0)
-    except ResizeScreenError as e:
-        last_scene = e.scenelayout.add_widget(VerticalDivider())
+        while True:
+            # Check before drawing, as a resize usually arrives while waiting and the frame would be thrown away
+            if screen.has_resized():
+                current_scene = screen.current_scene
+                current_scene.exit()
+                raise ResizeScreenError("Screen resized", current_scene)
+            # Pace from the start of each frame, as input ends the wait early and the next frame must not be
+            # scheduled further ahead because of it
+            frame_start = time.monotonic()
+            screen.draw_next_frame()
+            delay = frame_start + frame_period - time.monotonic()
+            if delay > 0:
+                screen.wait_for_input(delay)
+    except StopApplication:
+        return
+
+
+@click.command()
+@click.option('--scheduler', default='tcp://127.0.0.1:8786', show_default=True, help='The Dask scheduler address.')
+@click.option('--fps', default=20, show_default=True, type=click.IntRange(1, 60), help='Frames drawn per second.')
+def main(scheduler: str, fps: int):
+    c = Client(scheduler)
+
+    workers = WorkerInfoManager(c)
+    workers.start()
+    last_scene = None
+    while True:
+        try:
+            Screen.wrapper(demo, arguments=[workers, last_scene, fps])
+            sys.exit(0)
+        except ResizeScreenError as e:
+            last_scene = e.scene
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,19 @@
 """Get data about Dask Workers and display their info in a scene."""
 
+import bisect
+import math
+import operator
+import statistics
 import time
-from datetime import datetime as dt
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
-from typing import Dict, List
+from typing import Collection, Deque, Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
 
+from asciimatics.event import KeyboardEvent
 from asciimatics.screen import Screen
-from asciimatics.widgets import Frame, Layout, Text, VerticalDivider, Label, Divider, MultiColumnListBox, Widget
+from asciimatics.widgets import Frame, Layout, Label, Divider, MultiColumnListBox
 from asciimatics.parsers import AsciimaticsParser
 from dask.distributed import Client
 
@@ -25,6 +29,97 @@ PALETTE = defaultdict(
 )
 """Our custom color scheme."""
 
+POLL_INTERVALS = {
+    'active': 0.5,
+    'steady': 2.0,
+    'idle': 5.0,
+}
+"""How many seconds to wait between scheduler polls for each level of cluster activity, fastest first."""
+
+SLOW_REFRESH = 0.25
+"""Scheduler round trips slower than this many seconds double the polling interval, faster ones halve it back down."""
+
+MAX_BACKOFF_INTERVAL = 30.0
+"""The longest, in seconds, that backing off from a slow scheduler will stretch the polling interval to."""
+
+WORKER_METRICS = ('memory', 'cpu', 'num_fds', 'executing', 'in_memory', 'ready', 'in_flight')
+"""The worker metrics fetched from the scheduler on each poll."""
+
+BYTE_SUFFIXES = ('B', 'KB', 'MB', 'GB', 'TB')
+"""Units for human readable byte counts, one per power of 1000."""
+
+BYTE_DIVISORS = (1, 1e3, 1e6, 1e9, 1e12)
+"""The number of bytes in each of `BYTE_SUFFIXES`."""
+
+DECIMAL_FORMAT = '%.2f'
+"""Format for averages shown in the rollup."""
+
+PERCENT_FORMAT = '%.2f%%'
+"""Format for percentages shown in the rollup."""
+
+MEMORY_FORMAT = '%.2f%% (%s/%s)'
+"""Format for a worker's memory utilization: the percent used, then the bytes used and available."""
+
+ROW_KEY = operator.attrgetter(
+    'cpu', 'current_memory', 'max_memory', 'fds', 'executing', 'in_memory', 'ready', 'in_flight',
+)
+"""Get the raw metrics a worker's display row is formatted from, to tell whether it needs formatting again."""
+
+TIMING_SAMPLES = 128
+"""How many of the most recent timings to keep for each phase of an update."""
+
+DEBUG_KEYS = (ord('d'), ord('D'))
+"""Keys that toggle the timing overlay."""
+
+CPU_THRESHOLDS = (40, 75)
+"""The CPU utilization percentages at which a worker's CPU changes color, up to 100%."""
+
+CPU_COLORS = ('', '${3}', '${1}')
+"""The color of a worker's CPU utilization below, between and above `CPU_THRESHOLDS`."""
+
+CPU_OVERLOAD_COLOR = '${2}'
+"""The color of a worker's CPU utilization above 100%, i.e. when it is using more than one core."""
+
+MEMORY_THRESHOLDS = (0.5, 0.75)
+"""The memory utilization fractions at which a worker's memory changes color."""
+
+MEMORY_COLORS = ('', '${3}', '${1}')
+"""The color of a worker's memory utilization below, between and above `MEMORY_THRESHOLDS`."""
+
+
+def _human_bytes(byte_count: int) -> str:
+    """Get a human readable byte count. Currently up to Terabytes.
+
+    Args:
+        byte_count: The non-adjusted byte count to convert
+
+    Returns:
+        The adjusted byte count, to make it more human readable
+
+    """
+    idx = min(int(math.log10(max(byte_count, 1)) // 3), len(BYTE_SUFFIXES) - 1)
+    return f'{byte_count / BYTE_DIVISORS[idx]:.2f} {BYTE_SUFFIXES[idx]}'
+
+
+def _format_timing(name: str, samples: Deque[float]) -> str:
+    """Format the median and 95th percentile of a phase's timings.
+
+    Args:
+        name: The name of the phase
+        samples: The phase's most recent timings in seconds
+
+    Returns:
+        The formatted timings in milliseconds
+
+    """
+    if len(samples) < 2:
+        p50 = p95 = samples[0] if samples else 0.0
+    else:
+        # Inclusive, so that a handful of samples is not extrapolated past the slowest of them
+        quantiles = statistics.quantiles(samples, n=20, method='inclusive')
+        p50, p95 = quantiles[9], quantiles[18]
+    return f'{name} {p50 * 1e3:.1f}/{p95 * 1e3:.1f}ms'
+
 
 @dataclass
 class WorkerInfoModel:
@@ -38,9 +133,32 @@ class WorkerInfoModel:
         in_memory: The number of tasks that are in memory on the worker
         ready: The number of tasks that are ready on the worker
         in_flight: The number of tasks that are inflight on the worker
+        memory_util: The Dask worker's memory utilization as a fraction of `max_memory`
 
     """
 
+    # There is a model for every worker in the cluster, so use slots rather than a __dict__ for each. The display
+    # values after `memory_util` are derived in `_format` and are not dataclass fields.
+    __slots__ = (
+        'addr',
+        'max_memory',
+        'current_memory',
+        'cpu',
+        'fds',
+        'executing',
+        'in_memory',
+        'ready',
+        'in_flight',
+        'memory_util',
+        'memory_pct',
+        'max_memory_str',
+        'fds_s',
+        'executing_s',
+        'in_memory_s',
+        'ready_s',
+        'in_flight_s',
+    )
+
     addr: str
     max_memory: int
     current_memory: int
@@ -50,6 +168,20 @@ class WorkerInfoModel:
     in_memory: int
     ready: int
     in_flight: int
+    memory_util: float
+
+    def __post_init__(self):
+        self._format()
+
+    def _format(self) -> None:
+        """Format the displayed values once at ingest rather than on every render."""
+        self.memory_pct = self.memory_util * 100.0
+        self.max_memory_str = _human_bytes(self.max_memory)
+        self.fds_s = str(self.fds)
+        self.executing_s = str(self.executing)
+        self.in_memory_s = str(self.in_memory)
+        self.ready_s = str(self.ready)
+        self.in_flight_s = str(self.in_flight)
 
     @classmethod
     def from_worker(cls: 'WorkerInfoModel', addr: str, info: Dict) -> 'WorkerInfoModel':
@@ -62,22 +194,171 @@ class WorkerInfoModel:
         Returns:
             The `WorkerInfo` object from the dictionary
         """
+        return cls(addr, *cls._parse(info))
+
+    def update(self, info: Dict) -> None:
+        """Update the worker in place from a worker info dictionary.
+
+        Args:
+            info: The dictionary containing the Dask worker information
+
+        """
+        (
+            self.max_memory,
+            self.current_memory,
+            self.cpu,
+            self.fds,
+            self.executing,
+            self.in_memory,
+            self.ready,
+            self.in_flight,
+            self.memory_util,
+        ) = self._parse(info)
+        self._format()
+
+    @staticmethod
+    def _parse(info: Dict) -> Tuple[int, int, float, int, int, int, int, int, float]:
+        """Read the fields after `addr` from a worker info dictionary, in the order they are declared.
+
+        Args:
+            info: The dictionary containing the Dask worker information
+
+        Returns:
+            The worker's fields, other than its address
+
+        """
+        metrics = info['metrics']
+        # Workers started without a memory limit report it as 0 or None, so treat both as 0
+        max_memory = info['memory_limit'] or 0
+        current_memory = metrics['memory']
+        return (
+            max_memory,
+            current_memory,
+            metrics['cpu'],
+            metrics['num_fds'],
+            metrics['executing'],
+            metrics['in_memory'],
+            metrics['ready'],
+            metrics['in_flight'],
+            current_memory / max_memory if max_memory else 0.0,
+        )
+
+
+class WorkerMetrics(NamedTuple):
+    """Worker information stored as one tuple per metric, in the same order as the workers it was read from.
+
+    Rollups across the cluster become a single `sum` over a column instead of a Python loop over workers, so
+    only the columns that are rolled up are kept.
+
+    Args:
+        memory_util: The memory utilization of each worker as a fraction
+        cpu: The CPU utilization of each worker as a percent
+        fds: The number of file descriptors open on each worker
+        executing: The number of tasks executing on each worker
+        in_memory: The number of tasks that are in memory on each worker
+        ready: The number of tasks that are ready on each worker
+        in_flight: The number of tasks that are inflight on each worker
+
+    """
+
+    memory_util: Tuple[float, ...]
+    cpu: Tuple[float, ...]
+    fds: Tuple[int, ...]
+    executing: Tuple[int, ...]
+    in_memory: Tuple[int, ...]
+    ready: Tuple[int, ...]
+    in_flight: Tuple[int, ...]
+
+    @classmethod
+    def from_workers(cls, workers: Collection[WorkerInfoModel]) -> 'WorkerMetrics':
+        """Transpose a collection of `WorkerInfoModel` objects into per-metric columns.
+
+        Each worker's metrics are read in one `attrgetter` call and the columns are the tuples `zip` builds, so
+        nothing is copied.
+
+        Args:
+            workers: The workers to transpose
+
+        Returns:
+            The `WorkerMetrics` for the workers
+
+        """
+        if not workers:
+            return cls(*(() for _ in cls._fields))
+        return cls(*zip(*map(WORKER_METRICS_GETTER, workers)))
+
+
+WORKER_METRICS_GETTER = operator.attrgetter(*WorkerMetrics._fields)
+"""Get every metric of a worker as a tuple, in the order of the `WorkerMetrics` columns."""
+
+
+class WorkerTotals(NamedTuple):
+    """Worker information summed across the cluster.
+
+    Args:
+        num_workers: The number of workers
+        cpu: The total CPU utilization of the workers as a percent
+        memory_util: The total memory utilization of the workers as a fraction
+        fds: The total number of file descriptors open on the workers
+        executing: The total number of tasks executing on the workers
+        in_memory: The total number of tasks that are in memory on the workers
+        ready: The total number of tasks that are ready on the workers
+        in_flight: The total number of tasks that are inflight on the workers
+
+    """
+
+    num_workers: int
+    cpu: float
+    memory_util: float
+    fds: int
+    executing: int
+    in_memory: int
+    ready: int
+    in_flight: int
+
+    @classmethod
+    def from_metrics(cls, metrics: WorkerMetrics) -> 'WorkerTotals':
+        """Sum each column of a `WorkerMetrics`.
+
+        Args:
+            metrics: The per-metric columns to sum
+
+        Returns:
+            The `WorkerTotals` for the columns
+
+        """
         return cls(
-            addr=addr,
-            max_memory=info['memory_limit'],
-            current_memory=info['metrics']['memory'],
-            cpu=info['metrics']['cpu'],
-            fds=info['metrics']['num_fds'],
-            executing=info['metrics']['executing'],
-            in_memory=info['metrics']['in_memory'],
-            ready=info['metrics']['ready'],
-            in_flight=info['metrics']['in_flight'],
+            num_workers=len(metrics.cpu),
+            cpu=sum(metrics.cpu),
+            memory_util=sum(metrics.memory_util),
+            fds=sum(metrics.fds),
+            executing=sum(metrics.executing),
+            in_memory=sum(metrics.in_memory),
+            ready=sum(metrics.ready),
+            in_flight=sum(metrics.in_flight),
         )
 
-    @property
-    def memory_util(self) -> float:
-        """The Dask worker's memory utilization as a percent."""
-        return self.current_memory / self.max_memory
+    def format_rollup(self) -> List[str]:
+        """Format the cluster rollup row, averaging CPU and memory across the workers.
+
+        Returns:
+            The formatted rollup row
+
+        """
+        num_workers = self.num_workers
+        # An empty cluster, e.g. while workers are still starting, averages to 0
+        inv_num_workers = 1.0 / num_workers if num_workers else 0.0
+        return [
+            str(num_workers),
+            DECIMAL_FORMAT % (self.cpu * inv_num_workers),
+            PERCENT_FORMAT % (self.memory_util * inv_num_workers * 100),
+            str(self.fds),
+            str(self.executing),
+            str(self.in_memory),
+            str(self.ready),
+            str(self.in_flight),
+        ]
+
 
 class WorkerInfoManager:
     """Manage refreshes of worker information as well as provide rollups
@@ -90,13 +371,331 @@ class WorkerInfoManager:
 
     def __init__(self, dask_client: Client):
         self._client: Client = dask_client
-        self.workers: List[WorkerInfoModel] = []
+        self.workers: Dict[str, WorkerInfoModel] = {}
+        self.totals: WorkerTotals = WorkerTotals.from_metrics(WorkerMetrics.from_workers([]))
+        self.rows: List[Tuple[str, ...]] = []
+        self.generation = 0
+        self._row_cache: Dict[str, Tuple[Tuple, Tuple[str, ...]]] = {}
+        self._last_worker_info: Optional[Dict[str, Dict]] = None
+        self.poll_error: Optional[str] = None
+        self.updated_at_int = 0
+        self.updated_at_str = ''
+        self.refresh_timings: Deque[float] = deque(maxlen=TIMING_SAMPLES)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._min_interval = POLL_INTERVALS['active']
+        self._max_interval = POLL_INTERVALS['idle']
+        self._poll_state = 'steady'
+        self._pending_state = self._poll_state
+        self._pending_ticks = 0
+        self._backoff = 1.0
         self._refresh()
 
-    def _refresh(self) -> None:
-        """Update worker information."""
-        worker_info = self._client.scheduler_info()['workers']
-        self.workers = [WorkerInfoModel.from_worker(addr, info) for addr, info in worker_info.items()]
+    def _refresh(self) -> bool:
+        """Update worker information.
+
+        Returns:
+            Whether the poll changed any worker's row or the totals
+
+        """
+
+        # Defined inline, rather than at module level, so that it is pickled by value and dtop does not need
+        # to be importable on the scheduler.
+        def worker_metrics(dask_scheduler, metrics=WORKER_METRICS):
+            return {
+                addr: {
+                    'memory_limit': ws.memory_limit,
+                    'metrics': {metric: ws.metrics[metric] for metric in metrics},
+                }
+                for addr, ws in dask_scheduler.workers.items()
+            }
+
+        start = time.perf_counter()
+        worker_info = self._client.run_on_scheduler(worker_metrics)
+        self.refresh_timings.append(time.perf_counter() - start)
+
+        updated_at = int(time.time())
+        # An idle cluster reports the same metrics poll after poll, so there is nothing to rebuild
+        if worker_info == self._last_worker_info:
+            self._set_updated_at(updated_at)
+            return False
+
+        # Only the poller touches the models, so they can be updated in place and only created for new workers
+        workers = self.workers
+        get_worker = workers.get
+        from_worker = WorkerInfoModel.from_worker
+        for addr, info in worker_info.items():
+            worker = get_worker(addr)
+            if worker is None:
+                workers[addr] = from_worker(addr, info)
+            else:
+                worker.update(info)
+        for addr in workers.keys() - worker_info.keys():
+            del workers[addr]
+
+        totals = WorkerTotals.from_metrics(WorkerMetrics.from_workers(workers.values()))
+        rows = self.formatted_rows(workers.values())
+        # Unchanged rows are the same cached tuples, so comparing against the last poll is cheap
+        changed = rows != self.rows or totals != self.totals
+        with self._lock:
+            self.totals = totals
+            self.rows = rows
+            if changed:
+                self.generation += 1
+        # Only skip matching polls once this one has been fully applied
+        self._last_worker_info = worker_info
+        self._set_updated_at(updated_at)
+        return changed
+
+    def _set_updated_at(self, updated_at: int) -> None:
+        """Record when the worker information was last refreshed, formatting it at most once per second.
+
+        Args:
+            updated_at: The refresh time in whole seconds since the epoch
+
+        """
+        if updated_at != self.updated_at_int:
+            with self._lock:
+                self.updated_at_int = updated_at
+                self.updated_at_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))
+
+    def _next_interval(self, changed: bool) -> float:
+        """Classify the cluster's activity at the last poll and pick the next polling interval.
+
+        The cluster is `active` while any worker has executing, ready or in flight tasks, `steady` while the
+        poll changed the workers' metrics, e.g. CPU or memory, and `idle` when nothing changed. Speeding up
+        happens immediately, slowing down only once the slower state has been seen on two consecutive ticks, so
+        the interval does not flap.
+
+        Args:
+            changed: Whether the last poll changed any worker's row or the totals
+
+        Returns:
+            The number of seconds to wait before the next poll
+
+        """
+        if self.totals.executing + self.totals.ready + self.totals.in_flight:
+            state = 'active'
+        elif changed:
+            state = 'steady'
+        else:
+            state = 'idle'
+
+        if POLL_INTERVALS[state] < POLL_INTERVALS[self._poll_state]:
+            self._poll_state = state
+            self._pending_ticks = 0
+        elif state != self._poll_state:
+            if state == self._pending_state:
+                self._pending_ticks += 1
+            else:
+                self._pending_state = state
+                self._pending_ticks = 1
+            if self._pending_ticks >= 2:
+                self._poll_state = state
+                self._pending_ticks = 0
+        else:
+            self._pending_ticks = 0
+
+        interval = self._state_interval()
+        return max(interval, min(interval * self._backoff, MAX_BACKOFF_INTERVAL))
+
+    def _state_interval(self) -> float:
+        """The polling interval for the current activity state, before any backoff."""
+        return min(max(POLL_INTERVALS[self._poll_state], self._min_interval), self._max_interval)
+
+    def _update_backoff(self, rpc_time: float) -> None:
+        """Back off from, or recover towards, the normal polling interval based on how long the scheduler took.
+
+        Args:
+            rpc_time: The number of seconds the last scheduler round trip took
+
+        """
+        if rpc_time > SLOW_REFRESH:
+            # Stop growing once the current interval is stretched to the limit, so recovery is quick
+            self._backoff = min(self._backoff * 2, MAX_BACKOFF_INTERVAL / self._state_interval())
+        else:
+            self._backoff = max(self._backoff / 2, 1.0)
+
+    def _poll_once(self) -> float:
+        """Refresh worker information once, recording whether it failed.
+
+        Returns:
+            The number of seconds to wait before the next poll
+
+        """
+        try:
+            changed = self._refresh()
+            rpc_time = self.refresh_timings[-1]
+            self._set_poll_error(None)
+        except Exception as e:
+            # Keep polling, showing the last good poll along with why it is stale, and treat it as very slow
+            changed = False
+            rpc_time = math.inf
+            self._set_poll_error(f'{type(e).__name__}: {e}')
+        self._update_backoff(rpc_time)
+        return self._next_interval(changed)
+
+    def _poll(self) -> None:
+        """Refresh worker information until `stop` is called."""
+        while not self._stop_event.is_set():
+            self._stop_event.wait(self._poll_once())
+
+    def _set_poll_error(self, error: Optional[str]) -> None:
+        """Record why the last poll failed, advancing the generation so the scene shows the change.
+
+        Args:
+            error: A description of the failure, or None if the poll succeeded
+
+        """
+        if error != self.poll_error:
+            with self._lock:
+                self.poll_error = error
+                self.generation += 1
+
+    @property
+    def min_interval(self) -> float:
+        """The shortest time, in seconds, between polls."""
+        return self._min_interval
+
+    def set_min_interval(self, interval: float) -> None:
+        """Set the shortest time to wait between polls, used while the cluster is busy.
+
+        Args:
+            interval: The minimum number of seconds between refreshes
+
+        """
+        if interval <= 0:
+            raise ValueError(f'Polling interval must be positive, got {interval}')
+        self._min_interval = interval
+        self._max_interval = max(self._max_interval, interval)
+
+    def set_max_interval(self, interval: float) -> None:
+        """Set the longest time to wait between polls, used while the cluster is idle.
+
+        Args:
+            interval: The maximum number of seconds between refreshes
+
+        """
+        if interval <= 0:
+            raise ValueError(f'Polling interval must be positive, got {interval}')
+        self._max_interval = interval
+        self._min_interval = min(self._min_interval, interval)
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Start polling the Dask scheduler on a background thread.
+
+        Args:
+            interval: Poll on this fixed number of seconds instead of adapting to cluster activity
+
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if interval is not None:
+            self.set_min_interval(interval)
+            self.set_max_interval(interval)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll, name='dtop-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background poller, if it is running."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def snapshot(self) -> Tuple[List[Tuple[str, ...]], WorkerTotals]:
+        """Get the most recently polled worker information.
+
+        Each refresh replaces, rather than mutates, the rows and totals, so they are safe to read while the
+        poller runs.
+
+        Returns:
+            The formatted display row for each worker and the totals across the workers
+
+        """
+        with self._lock:
+            return self.rows, self.totals
+
+    def formatted_rows(self, workers: Collection[WorkerInfoModel]) -> List[Tuple[str, ...]]:
+        """Format the display row of each worker.
+
+        Rows are cached by worker address along with the metrics they were formatted from, and only formatted
+        again when those metrics change. Departed workers are dropped from the cache.
+
+        Args:
+            workers: The workers to format
+
+        Returns:
+            The formatted display row for each worker
+
+        """
+        # Hoist the lookups out of the loop, it runs once per worker per poll
+        get_cached = self._row_cache.get
+        format_row = self._format_row
+        row_cache: Dict[str, Tuple[Tuple, Tuple[str, ...]]] = {}
+        rows: List[Tuple[str, ...]] = []
+        append_row = rows.append
+        for worker in workers:
+            addr = worker.addr
+            key = ROW_KEY(worker)
+            cached = get_cached(addr)
+            row = cached[1] if cached is not None and cached[0] == key else format_row(worker)
+            row_cache[addr] = (key, row)
+            append_row(row)
+        self._row_cache = row_cache
+        return rows
+
+    def _format_row(self, worker: WorkerInfoModel) -> Tuple[str, ...]:
+        """Format the display row of a worker.
+
+        Args:
+            worker: The `WorkerInfoModel` to format
+
+        Returns:
+            The formatted display row
+
+        """
+        cpu = worker.cpu
+        cpu_color = CPU_COLORS[bisect.bisect_right(CPU_THRESHOLDS, cpu)] if cpu <= 100 else CPU_OVERLOAD_COLOR
+        memory_color = MEMORY_COLORS[bisect.bisect_right(MEMORY_THRESHOLDS, worker.memory_util)]
+        return (
+            worker.addr,
+            cpu_color + str(cpu),
+            memory_color + self._format_mem(worker),
+            worker.fds_s,
+            worker.executing_s,
+            worker.in_memory_s,
+            worker.ready_s,
+            worker.in_flight_s,
+        )
+
+    @staticmethod
+    def _get_human_readable_byte_count(byte_count: int) -> str:
+        """Get a human readable byte count. Currently up to Terabytes.
+
+        Args:
+            byte_count: The non-adjusted byte count to convert
+
+        Returns:
+            The adjusted byte count, to make it more human readable
+
+        """
+        return _human_bytes(int(byte_count))
+
+    def _format_mem(self, worker: WorkerInfoModel) -> str:
+        """Format the memory utilization for a worker, without its color.
+
+        Args:
+            worker: The `WorkerInfoModel` for which the memory utilization is formatted
+
+        Returns:
+            The formatted memory utilization
+
+        """
+        mem_used = self._get_human_readable_byte_count(worker.current_memory)
+        return MEMORY_FORMAT % (worker.memory_pct, mem_used, worker.max_memory_str)
 
     @property
     def worker_count(self):
@@ -109,18 +708,33 @@ class WorkerInfoScene(Frame):
     Args:
         screen: The screen on which this scene will be displayed
         worker_info_manager: The `WorkerInfoManager` used to render the scene
+        fps: The number of frames the screen draws per second
 
     """
 
-    def __init__(self, screen, worker_info_manager: WorkerInfoManager):
+    def __init__(self, screen, worker_info_manager: WorkerInfoManager, fps: int = 20):
         super(WorkerInfoScene, self).__init__(screen, screen.height, screen.width, title='Worker Info', reduce_cpu=False)
 
-        self._last_frame = 0
+        self._last_generation: Optional[int] = None
         self._model = worker_info_manager
-        self._model._refresh()
-        self.data =  {'updated_at': str(dt.now())}
+        self._fps = fps
+        self._row_options: List[Tuple[List[str], int]] = []
+        self._row_keys: List[Tuple[str, ...]] = []
+        self._last_rollup_key: Optional[WorkerTotals] = None
+        self._last_rollup: Optional[List[str]] = None
+        self._show_debug = False
+        self._debug_text = ''
+        self._needs_draw = True
+        self._aggregate_timings: Deque[float] = deque(maxlen=TIMING_SAMPLES)
+        self._render_timings: Deque[float] = deque(maxlen=TIMING_SAMPLES)
+        self.data =  {'updated_at': self._model.updated_at_str}
         self.palette = PALETTE
 
+        debug_layout = Layout([100])
+        self.add_layout(debug_layout)
+        self.debug_widget = Label('', align='>')
+        debug_layout.add_widget(self.debug_widget)
+
         rollup_layout = Layout([100])
         self.add_layout(rollup_layout)
         self.rollup_widget = MultiColumnListBox(
@@ -178,138 +792,108 @@ class WorkerInfoScene(Frame):
         self.fix()
 
     def _update(self, frame_no: int) -> None:
-        """Override the method to force a poll of the Dask cluster on a regular interval.
-
-        Args:
-            frame_no: The number of the frame that should be rendered
-
-        """
-        if frame_no - self._last_frame >= self.frame_update_count or self._last_frame == 0:
-
-            self._last_frame = frame_no
-            self._model._refresh()
-            worker_options = []
-            cpu_total = 0.0
-            mem_total = 0.0
-            fds_total = 0
-            exec_total = 0
-            in_mem_total = 0
-            ready_total = 0
-            in_flight_total = 0
-            for idx, worker in enumerate(self._model.workers):
-                worker_options.append(
-                    (
-                        [
-                            worker.addr,
-                            self._format_cpu(worker),
-                            self._format_mem(worker),
-                            str(worker.fds),
-                            str(worker.executing),
-                            str(worker.in_memory),
-                            str(worker.ready),
-                            str(worker.in_flight)
-                        ],
-                        idx,
-                    )
-                )
-
-                cpu_total += worker.cpu
-                mem_total += worker.memory_util
-                fds_total += worker.fds
-                exec_total += worker.executing
-                in_mem_total += worker.in_memory
-                ready_total += worker.ready
-                in_flight_total += worker.in_flight
-
-
-            self.worker_widget.options = worker_options
-
-            num_workers = len(self._model.workers)
-            self.rollup_widget.options = [
-                (
-                    [
-                        str(num_workers),
-                        f'{cpu_total / num_workers:.2f}',
-                        f'{mem_total / num_workers * 100:.2f}%',
-                        str(fds_total),
-                        str(exec_total),
-                        str(in_mem_total),
-                        str(ready_total),
-                        str(in_flight_total)
-                    ],
-                    0,
-                 )
-
-            ]
-        super(WorkerInfoScene, self)._update(frame_no)
+        """Override the method to render the latest poll of the Dask cluster whenever it has changed.
 
-    @property
-    def frame_update_count(self) -> int:
-        """How often this scene should be updated.
-
-        Returns:
-            How many redraws should occur before this scene is updated
-
-        """
-        return 20 # 20 == 1 second
+        The manager's `generation` only advances when a poll changes a row or the totals, so updates in between,
+        e.g. for key presses, skip straight to drawing. When there is neither new data nor an event to respond
+        to, the frame is not redrawn at all and the screen keeps what it last showed.
 
-    @staticmethod
-    def _get_human_readable_byte_count(byte_count: int) -> str:
-        """Get a human readable byte count. Currently up to Gigabytes.
+        The polled rows are copied into a buffer of cell lists that is reused across updates, and the widget
+        options are only replaced when a cell has changed since the last update. The time spent on the rows and
+        rollup, and on drawing the frame, is recorded for the timing overlay, which is rebuilt on every update
+        while it is shown. While polling is failing, the error is shown in place of the overlay.
 
         Args:
-            byte_count: The non-adjusted byte count to convert
-
-        Returns:
-            The adjusted byte count, to make it more human readable
+            frame_no: The number of the frame that should be rendered
 
         """
-        gigabytes = byte_count / 1e9
-        if gigabytes > 1:
-            return f'{gigabytes:.2f} GB'
-
-        megabytes = byte_count / 1e6
-        if megabytes > 1:
-            return f'{megabytes:.2f} MB'
-
+        generation = self._model.generation
+        if generation != self._last_generation:
+
+            start = time.perf_counter()
+            self._last_generation = generation
+            self._needs_draw = True
+            rows, totals = self._model.snapshot()
+            row_options = self._row_options
+            row_keys = self._row_keys
+            changed = len(row_options) != len(rows)
+            del row_options[len(rows):]
+            del row_keys[len(rows):]
+            for idx, row in enumerate(rows):
+                if idx == len(row_options):
+                    row_options.append((list(row), idx))
+                    row_keys.append(row)
+                elif row != row_keys[idx]:
+                    # Each row's tuple is its diff key, so an unchanged row costs one comparison, not one per cell
+                    row_options[idx][0][:] = row
+                    row_keys[idx] = row
+                    changed = True
+
+            if changed:
+                # The setter parses the cells into coloured text, so it must be called for changes to show
+                self.worker_widget.options = row_options
+
+            # Only format the rollup when the totals it is formatted from have changed
+            if totals != self._last_rollup_key:
+                self._last_rollup_key = totals
+                rollup = totals.format_rollup()
+                # Totals often move without changing what is shown, e.g. a CPU average that rounds the same
+                if rollup != self._last_rollup:
+                    self._last_rollup = rollup
+                    self.rollup_widget.options = [(rollup, 0)]
+            self._aggregate_timings.append(time.perf_counter() - start)
+
+        # Rebuilt on every update, as the refresh timings keep coming in while the cluster is idle
+        poll_error = self._model.poll_error
+        if poll_error is not None:
+            debug_text = f'Polling failed, showing {self._model.updated_at_str}: {poll_error}'
+        elif self._show_debug:
+            debug_text = '  '.join((
+                _format_timing('refresh', self._model.refresh_timings),
+                _format_timing('agg', self._aggregate_timings),
+                _format_timing('render', self._render_timings),
+                '(p50/p95)',
+            ))
+        else:
+            debug_text = ''
+        if debug_text != self._debug_text:
+            self._debug_text = debug_text
+            self.debug_widget.text = debug_text
+            self._needs_draw = True
+
+        if not self._needs_draw:
+            return
+        self._needs_draw = False
+
+        start = time.perf_counter()
+        super(WorkerInfoScene, self)._update(frame_no)
+        self._render_timings.append(time.perf_counter() - start)
 
-    def _format_cpu(self, worker: WorkerInfoModel) -> str:
-        """Format the CPU utilization for a worker.
+    def process_event(self, event):
+        """Toggle the timing overlay on `d`, passing every other event on to the frame.
 
         Args:
-            worker: The `WorkerInfoModel` for which the CPU utilization is formatted
+            event: The event to process
 
         Returns:
-            The formatted CPU utilization
+            None if the event toggled the overlay, otherwise the result of the frame's processing
 
         """
-        cpu_perc = worker.cpu
-        color = ""
-        if 40 <= cpu_perc < 75:
-            color = "${3}"
-        elif 75 <= cpu_perc <= 100:
-            color = "${1}"
-        elif 100 < cpu_perc:
-            color = "${2}"
-        return f'{color}{cpu_perc}'
+        # Whatever the event does to the widgets, e.g. moving the selection, needs drawing
+        self._needs_draw = True
+        if isinstance(event, KeyboardEvent) and event.key_code in DEBUG_KEYS:
+            self._show_debug = not self._show_debug
+            return None
+        return super(WorkerInfoScene, self).process_event(event)
 
-    def _format_mem(self, worker: WorkerInfoModel) -> str:
-        """Format the memory utilization for a worker.
+    @property
+    def frame_update_count(self) -> int:
+        """How often this scene should be updated.
 
-        Args:
-            worker: The `WorkerInfoModel` for which the memory utilization is formatted
+        There is no new data to show more often than the worker information is polled.
 
         Returns:
-            The formatted memory utilization
+            How many redraws should occur before this scene is updated
 
         """
-        memory_perc = worker.memory_util
-        mem_used = self._get_human_readable_byte_count(worker.current_memory)
-        mem_total = self._get_human_readable_byte_count(worker.max_memory)
-        mem = f'{memory_perc * 100:.2f}% ({mem_used}/{mem_total})'
-        color = ""
-        if 0.5 <= memory_perc < 0.75:
-            color = "${3}"
-        elif 0.75 <= memory_perc <= 1.0:
-            color = "${1}"
-        return f'{color}{mem}'
+        return max(1, round(self._fps * self._model.min_interval))
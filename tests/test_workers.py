@@ -0,0 +1,264 @@
+"""Tests for the worker information formatting and polling."""
+
+import math
+from collections import deque
+
+import pytest
+
+from dtop.workers import (
+    MAX_BACKOFF_INTERVAL,
+    POLL_INTERVALS,
+    WorkerInfoManager,
+    WorkerInfoModel,
+    WorkerMetrics,
+    WorkerTotals,
+    _format_timing,
+    _human_bytes,
+)
+
+
+class FakeClient:
+    """Stands in for a Dask client, answering every scheduler call with canned worker information."""
+
+    def __init__(self, worker_info=None):
+        self.worker_info = {} if worker_info is None else worker_info
+
+    def run_on_scheduler(self, function):
+        if isinstance(self.worker_info, Exception):
+            raise self.worker_info
+        return self.worker_info
+
+
+def _worker_info(memory_limit=4096, memory=1024, cpu=12.5, executing=1):
+    return {
+        'memory_limit': memory_limit,
+        'metrics': {
+            'memory': memory,
+            'cpu': cpu,
+            'num_fds': 20,
+            'executing': executing,
+            'in_memory': 2,
+            'ready': 0,
+            'in_flight': 0,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    'byte_count, expected',
+    [
+        (0, '0.00 B'),
+        (1, '1.00 B'),
+        (512, '512.00 B'),
+        (999, '999.00 B'),
+        (1_500, '1.50 KB'),
+        (123_456, '123.46 KB'),
+        (999_000, '999.00 KB'),
+    ],
+)
+def test_human_bytes_below_a_megabyte(byte_count, expected):
+    assert _human_bytes(byte_count) == expected
+
+
+@pytest.mark.parametrize(
+    'byte_count, expected',
+    [
+        (10 ** 3 - 1, '999.00 B'),
+        (10 ** 3, '1.00 KB'),
+        (10 ** 6, '1.00 MB'),
+        (10 ** 9, '1.00 GB'),
+        (10 ** 12, '1.00 TB'),
+        (10 ** 15, '1000.00 TB'),
+    ],
+)
+def test_human_bytes_unit_boundaries(byte_count, expected):
+    assert _human_bytes(byte_count) == expected
+
+
+@pytest.mark.parametrize(
+    'byte_count, expected',
+    [
+        (5_500_000, '5.50 MB'),
+        (123_456_789, '123.46 MB'),
+        (10 ** 12, '1.00 TB'),
+    ],
+)
+def test_byte_count_is_not_rounded(byte_count, expected):
+    assert WorkerInfoManager._get_human_readable_byte_count(byte_count) == expected
+
+
+def test_worker_memory_utilization():
+    worker = WorkerInfoModel.from_worker('tcp://127.0.0.1:1', _worker_info(4096, memory=1024))
+
+    assert worker.memory_util == 0.25
+    assert worker.memory_pct == 25.0
+    assert worker.max_memory_str == '4.10 KB'
+
+
+@pytest.mark.parametrize('memory_limit', [0, None])
+def test_worker_without_memory_limit(memory_limit):
+    worker = WorkerInfoModel.from_worker('tcp://127.0.0.1:1', _worker_info(memory_limit))
+
+    assert worker.max_memory == 0
+    assert worker.memory_util == 0.0
+    assert worker.memory_pct == 0.0
+    assert worker.max_memory_str == '0.00 B'
+
+
+@pytest.mark.parametrize('memory_limit', [0, None])
+def test_worker_update_without_memory_limit(memory_limit):
+    worker = WorkerInfoModel.from_worker('tcp://127.0.0.1:1', _worker_info(4096))
+
+    worker.update(_worker_info(memory_limit, memory=2048))
+
+    assert worker.max_memory == 0
+    assert worker.current_memory == 2048
+    assert worker.memory_util == 0.0
+    assert worker.max_memory_str == '0.00 B'
+
+
+def test_backoff_recovers_after_a_transient_slow_poll():
+    manager = WorkerInfoManager(FakeClient())
+
+    manager._update_backoff(0.4)
+    assert manager._backoff == 2.0
+    # A remote scheduler's normal round trip is well above a local one's, but still not slow
+    for _ in range(20):
+        manager._update_backoff(0.1)
+
+    assert manager._backoff == 1.0
+
+
+def test_backoff_is_capped_against_the_current_interval():
+    manager = WorkerInfoManager(FakeClient())
+    manager._next_interval(False)
+    manager._next_interval(False)
+    assert manager._poll_state == 'idle'
+
+    for _ in range(10):
+        manager._update_backoff(math.inf)
+    assert manager._next_interval(False) == MAX_BACKOFF_INTERVAL
+
+    manager._update_backoff(0.1)
+    assert manager._next_interval(False) == MAX_BACKOFF_INTERVAL / 2
+    manager._update_backoff(0.1)
+    manager._update_backoff(0.1)
+    assert manager._next_interval(False) == POLL_INTERVALS['idle']
+
+
+@pytest.mark.parametrize(
+    'samples, expected',
+    [
+        ([], 'refresh 0.0/0.0ms'),
+        ([0.004], 'refresh 4.0/4.0ms'),
+        ([0.001, 0.010], 'refresh 5.5/9.5ms'),
+    ],
+)
+def test_format_timing_stays_within_the_samples(samples, expected):
+    assert _format_timing('refresh', deque(samples)) == expected
+
+
+def test_refresh_reports_changes():
+    client = FakeClient({'tcp://127.0.0.1:1': _worker_info(), 'tcp://127.0.0.1:2': _worker_info()})
+    manager = WorkerInfoManager(client)
+    generation = manager.generation
+
+    # An equal reply, even a fresh copy of it, changes nothing
+    client.worker_info = {addr: _worker_info() for addr in client.worker_info}
+    assert manager._refresh() is False
+    assert manager.generation == generation
+
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=50.0), 'tcp://127.0.0.1:2': _worker_info()}
+    assert manager._refresh() is True
+    assert manager.generation == generation + 1
+    assert manager.workers['tcp://127.0.0.1:1'].cpu == 50.0
+
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=50.0)}
+    assert manager._refresh() is True
+    assert manager.generation == generation + 2
+    assert list(manager.workers) == ['tcp://127.0.0.1:1']
+    rows, totals = manager.snapshot()
+    assert [row[0] for row in rows] == ['tcp://127.0.0.1:1']
+    assert totals.num_workers == 1
+
+
+def test_polling_interval_follows_cluster_activity():
+    client = FakeClient({'tcp://127.0.0.1:1': _worker_info(executing=2)})
+    manager = WorkerInfoManager(client)
+    assert manager._poll_once() == POLL_INTERVALS['active']
+
+    # Speeding up is immediate, slowing down takes two ticks of the slower state
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=20.0, executing=0)}
+    assert manager._poll_once() == POLL_INTERVALS['active']
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=30.0, executing=0)}
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+    assert manager._poll_once() == POLL_INTERVALS['idle']
+    assert manager._poll_once() == POLL_INTERVALS['idle']
+
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=40.0, executing=0)}
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=40.0, executing=1)}
+    assert manager._poll_once() == POLL_INTERVALS['active']
+
+
+def test_steady_state_needs_two_ticks_of_changes():
+    client = FakeClient({'tcp://127.0.0.1:1': _worker_info(executing=0)})
+    manager = WorkerInfoManager(client)
+    manager._poll_once()
+    manager._poll_once()
+    assert manager._poll_state == 'idle'
+
+    # A single changed poll speeds up straight away, but one unchanged poll afterwards does not slow down
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=20.0, executing=0)}
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info(cpu=30.0, executing=0)}
+    assert manager._poll_once() == POLL_INTERVALS['steady']
+
+
+def test_failed_poll_is_recorded():
+    client = FakeClient({'tcp://127.0.0.1:1': _worker_info()})
+    manager = WorkerInfoManager(client)
+    rows, totals = manager.snapshot()
+    generation = manager.generation
+
+    client.worker_info = RuntimeError('scheduler went away')
+    manager._poll_once()
+    assert manager.poll_error == 'RuntimeError: scheduler went away'
+    assert manager.generation == generation + 1
+    assert manager.snapshot() == (rows, totals)
+
+    # Failing the same way again is not news
+    manager._poll_once()
+    assert manager.generation == generation + 1
+
+    client.worker_info = {'tcp://127.0.0.1:1': _worker_info()}
+    manager._poll_once()
+    assert manager.poll_error is None
+    assert manager.generation == generation + 2
+
+
+def test_rollup_of_an_empty_cluster():
+    totals = WorkerTotals.from_metrics(WorkerMetrics.from_workers([]))
+
+    assert totals.format_rollup() == ['0', '0.00', '0.00%', '0', '0', '0', '0', '0']
+
+
+def test_refresh_of_an_empty_cluster():
+    manager = WorkerInfoManager(FakeClient({}))
+
+    rows, totals = manager.snapshot()
+    assert rows == []
+    assert totals.format_rollup() == ['0', '0.00', '0.00%', '0', '0', '0', '0', '0']
+
+
+def test_rollup_averages_cpu_and_memory():
+    client = FakeClient({
+        'tcp://127.0.0.1:1': _worker_info(memory=1024, cpu=10.0),
+        'tcp://127.0.0.1:2': _worker_info(memory=3072, cpu=30.0),
+    })
+    manager = WorkerInfoManager(client)
+
+    assert manager.totals.format_rollup() == ['2', '20.00', '50.00%', '40', '2', '4', '0', '0']